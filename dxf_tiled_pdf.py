@@ -1,25 +1,43 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+import io
 import math
 import argparse
+from collections import defaultdict
+import functools
+import importlib.util
 import os
-from dataclasses import dataclass
-from typing import Iterable, Tuple, List, Optional
-
-import ezdxf
-from ezdxf.math import Vec2
-from ezdxf.path import make_path
-from reportlab.pdfgen import canvas
+from multiprocessing import Pool
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Iterable, Tuple, List, Optional
+
+import numpy as np
+# Cheap constant-only modules; the heavy imports (ezdxf, reportlab.pdfgen,
+# numba, pypdf) are deferred to where they're used so `--help` and argument
+# errors stay fast.
 from reportlab.lib.units import inch, mm
 from reportlab.lib.pagesizes import letter, A4
 
+if TYPE_CHECKING:
+    import ezdxf
+    from reportlab.pdfgen import canvas
+
 # ----------------------------
 # Helpers / data structures
 # ----------------------------
 
+# Fixed page decorations, in points.
+SEAM_INSET_PT = 10 * mm  # seam lines stop this far from the paper edges
+SCALE_BAR_INSET_PT = 5 * mm  # scale bar offset from the printable left edge
+SCALE_BAR_DROP_PT = 8 * mm  # ... and below the printable top edge
 
-@dataclass
+# Entity geometry is drawn in 1/100 pt units so coordinates can be written to
+# the PDF as plain integers (see `begin_path_units` / `emit_polyline`).
+PATH_UNITS_PER_PT = 100
+
+
+@dataclass(slots=True)
 class PageSpec:
     width_pt: float
     height_pt: float
@@ -27,7 +45,7 @@ class PageSpec:
     overlap_pt: float
 
 
-@dataclass
+@dataclass(slots=True)
 class WorldToPage:
     # World units are whatever your DXF is in (often mm from Fusion).
     # scale_wu_to_pt converts world-unit lengths to PDF points.
@@ -44,6 +62,153 @@ class WorldToPage:
         y_pt = self.page_y0_pt + (y_wu - self.world_y0) * self.scale_wu_to_pt
         return x_pt, y_pt
 
+    def affine(self, units_per_pt: float = 1.0) -> Tuple[float, float, float]:
+        """Return (scale, tx, ty) such that page = world * scale + (tx, ty).
+
+        The result is in page units of 1/units_per_pt point. Hot drawing loops
+        unpack this once instead of reading dataclass attributes per point.
+        """
+        s = self.scale_wu_to_pt * units_per_pt
+        return (
+            s,
+            self.page_x0_pt * units_per_pt - self.world_x0 * s,
+            self.page_y0_pt * units_per_pt - self.world_y0 * s,
+        )
+
+
+@dataclass(slots=True)
+class PreparedEntity:
+    """Geometry of one DXF entity, extracted once before the tile loop.
+
+    Everything is in DXF world units so the same record can be drawn on any
+    tile by just changing the `WorldToPage` transform. Records are packed into
+    `EntityArrays` before tiling.
+    """
+    dxftype: str
+    bbox: Tuple[float, float, float, float]
+    # Vertices as an (N, 2) array for LINE/LWPOLYLINE/POLYLINE and sampled or
+    # flattened CIRCLE/ARC/SPLINE/ELLIPSE; None for POINT.
+    pts_wu: Optional[np.ndarray] = None
+    closed: bool = False
+    # POINT location.
+    center: Tuple[float, float] = (0.0, 0.0)
+    # Resolved linetype (dash is None for continuous / unresolvable patterns).
+    continuous: bool = True
+    dash: Optional[List[float]] = None
+
+
+@dataclass(slots=True)
+class EntityArrays:
+    """Prepared entities packed column-wise (row k = one entity) for tiling.
+
+    Vertices of all entities share one (M, 2) array in CSR layout: entity k
+    owns pts_wu[offsets[k]:offsets[k + 1]] (a POINT's location is its single
+    vertex). Types and dash patterns are small lookup tables indexed per row.
+    Drawers work on index arrays, and workers unpickle a few big arrays
+    instead of one object per entity.
+    """
+    type_names: Tuple[str, ...]
+    type_ids: np.ndarray  # (N,) into type_names
+    bbox: np.ndarray  # (N, 4) minx, miny, maxx, maxy
+    offsets: np.ndarray  # (N + 1,)
+    pts_wu: np.ndarray  # (M, 2)
+    closed: np.ndarray  # (N,) bool
+    dashes: Tuple[Tuple[float, ...], ...]  # dashes[0] == () is solid
+    dash_ids: np.ndarray  # (N,) into dashes
+
+    def __len__(self) -> int:
+        return len(self.type_ids)
+
+    @classmethod
+    def pack(cls, prepared: List[PreparedEntity]) -> EntityArrays:
+        type_index: dict = {}
+        dash_index: dict = {(): 0}
+        type_ids = np.empty(len(prepared), dtype=np.intp)
+        dash_ids = np.empty(len(prepared), dtype=np.intp)
+        counts = np.empty(len(prepared), dtype=np.intp)
+        parts = []
+        for k, rec in enumerate(prepared):
+            type_ids[k] = type_index.setdefault(rec.dxftype, len(type_index))
+            dash_ids[k] = dash_index.setdefault(
+                tuple(rec.dash) if rec.dash else (), len(dash_index))
+            pts = rec.pts_wu if rec.pts_wu is not None else np.array([rec.center])
+            counts[k] = len(pts)
+            parts.append(pts)
+        offsets = np.zeros(len(prepared) + 1, dtype=np.intp)
+        np.cumsum(counts, out=offsets[1:])
+        return cls(
+            type_names=tuple(type_index),
+            type_ids=type_ids,
+            bbox=np.array([rec.bbox for rec in prepared],
+                          dtype=np.float64).reshape(-1, 4),
+            offsets=offsets,
+            pts_wu=(np.concatenate(parts).astype(np.float64, copy=False)
+                    if parts else np.empty((0, 2), dtype=np.float64)),
+            closed=np.array([rec.closed for rec in prepared], dtype=bool),
+            dashes=tuple(dash_index),
+            dash_ids=dash_ids,
+        )
+
+
+@dataclass
+class TileJob:
+    """Everything needed to draw any one tile page (picklable for workers)."""
+    spec: PageSpec
+    scale_wu_to_pt: float
+    bbox: Tuple[float, float, float, float]
+    nx: int
+    ny: int
+    step_w_pt: float
+    step_h_pt: float
+    printable_w_pt: float
+    printable_h_pt: float
+    printable_w_wu: float
+    printable_h_wu: float
+    dxf_units: str
+    entities: EntityArrays
+    # Reused for every tile: only world_x0/world_y0 change per page.
+    xform: WorldToPage
+    # Place the shared "pattern" form instead of drawing entities per tile.
+    use_form: bool = False
+    # Page decorations: "edge" (seam lines) or "crop" (printable-area corners).
+    marks: str = "edge"
+    # (i, j) of the tile that carries the scale bar (the first page printed).
+    scale_bar_tile: Tuple[int, int] = (0, 0)
+    # (i, j) -> {dxftype: ascending row indices into entities} of the
+    # entities that touch that tile's printable area. Filled by bin_entities().
+    grid: dict = field(default_factory=dict, repr=False)
+
+    def tile_rect_wu(self, tile_x0_wu: float, tile_y0_wu: float) -> Tuple[float, float, float, float]:
+        """The tile's printable area as (minx, miny, maxx, maxy) in world units."""
+        return (tile_x0_wu, tile_y0_wu,
+                tile_x0_wu + self.printable_w_wu, tile_y0_wu + self.printable_h_wu)
+
+    def bin_entities(self, tiles: np.ndarray) -> None:
+        """Index every entity under each tile its bbox overlaps (edges count).
+
+        `tiles` is the full `compute_tiles` grid. Tiles are uniform, so the
+        covered tile range per axis is found by binary search over the tile
+        origins instead of testing every entity against every tile.
+        """
+        x0s = tiles[:self.nx, 2]
+        y0s = tiles[::self.nx, 3]
+        aabbs = self.entities.bbox
+        i0 = np.searchsorted(x0s + self.printable_w_wu, aabbs[:, 0], side="left")
+        i1 = np.searchsorted(x0s, aabbs[:, 2], side="right")
+        j0 = np.searchsorted(y0s + self.printable_h_wu, aabbs[:, 1], side="left")
+        j1 = np.searchsorted(y0s, aabbs[:, 3], side="right")
+
+        names = self.entities.type_names
+        grid = defaultdict(dict)
+        for k, (tid, a, b, c, d) in enumerate(zip(self.entities.type_ids.tolist(),
+                                                  i0.tolist(), i1.tolist(),
+                                                  j0.tolist(), j1.tolist())):
+            t = names[tid]
+            for j in range(c, d):
+                for i in range(a, b):
+                    grid[(i, j)].setdefault(t, []).append(k)
+        self.grid = dict(grid)
+
 
 def page_size(name: str) -> Tuple[float, float]:
     name = name.lower()
@@ -58,10 +223,11 @@ def page_size(name: str) -> Tuple[float, float]:
 # ----------------------------
 
 
-def iter_entities(doc: ezdxf.EzdxfDocument, layers: Optional[List[str]] = None):
+def iter_entities(doc: ezdxf.EzdxfDocument, layers: Optional[Iterable[str]] = None):
+    layer_set = frozenset(layers) if layers else None
     msp = doc.modelspace()
     for e in msp:
-        if layers and e.dxf.layer not in layers:
+        if layer_set is not None and e.dxf.layer not in layer_set:
             continue
         yield e
 
@@ -127,23 +293,26 @@ def _reportlab_dash_array_for_linetype(
 
     if not pattern_wu:
         return None
+    return list(_scaled_dash_pattern(tuple(pattern_wu), float(scale_wu_to_pt)))
+
 
+@functools.lru_cache(maxsize=None)
+def _scaled_dash_pattern(
+    pattern_wu: Tuple[float, ...], scale_wu_to_pt: float
+) -> Tuple[float, ...]:
+    """Scale a simplified DXF line pattern (drawing units) to a dash array in points."""
     # DXF linetype patterns are often visually "chunky" when mapped 1:1 into PDF.
     # Scale the dash/gap lengths down to get a finer-looking pattern.
     dash_scale = 0.3
 
-    pattern_pt: List[float] = []
-    for seg in pattern_wu:
-        seg_pt = float(seg) * float(scale_wu_to_pt) * dash_scale
-        # Avoid zeros which ReportLab dash can't represent.
-        if seg_pt <= 0:
-            seg_pt = 0.2 * mm
-        pattern_pt.append(seg_pt)
+    pattern_pt = np.asarray(pattern_wu, dtype=np.float64) * scale_wu_to_pt * dash_scale
+    # Avoid zeros which ReportLab dash can't represent.
+    pattern_pt[pattern_pt <= 0] = 0.2 * mm
 
     # ReportLab expects an even-length array; if odd, repeat it.
-    if len(pattern_pt) % 2 == 1:
-        pattern_pt = pattern_pt * 2
-    return pattern_pt
+    if pattern_pt.size % 2 == 1:
+        pattern_pt = np.tile(pattern_pt, 2)
+    return tuple(pattern_pt.tolist())
 
 
 def _flatten_path_entity_points(
@@ -151,142 +320,478 @@ def _flatten_path_entity_points(
     *,
     scale_wu_to_pt: Optional[float],
     flatten_mm: float,
-):
-    """Flatten a path-like DXF entity (e.g. SPLINE/ELLIPSE) into Vec3 points.
+) -> np.ndarray:
+    """Flatten a path-like DXF entity (e.g. SPLINE/ELLIPSE) into 2D points.
 
-    Returns a list of points in DXF world units.
+    Returns an (N, 2) float64 array of points in DXF world units; the array is
+    empty if the entity can't be flattened.
     """
+    empty = np.empty((0, 2), dtype=np.float64)
     if not scale_wu_to_pt:
-        return []
+        return empty
     flatten_dist_wu = (float(flatten_mm) * mm) / float(scale_wu_to_pt)
     if flatten_dist_wu <= 0:
-        return []
+        return empty
+    from ezdxf.path import make_path
+
     try:
         p = make_path(e)
-        return list(p.flattening(flatten_dist_wu))
+        pts = np.fromiter(
+            ((v.x, v.y) for v in p.flattening(flatten_dist_wu, segments=4)),
+            dtype=np.dtype((np.float64, 2)),
+        )
     except Exception:
-        return []
+        return empty
+    # ezdxf subdivides each curve segment uniformly, so nearly straight runs
+    # of long curves still come out dense; drop the points that don't change
+    # the shape.
+    if len(pts) < _SIMPLIFY_MIN_POINTS:
+        return pts
+    return _simplify_polyline(pts, 0.25 * flatten_dist_wu)
 
 
-def _draw_polyline_from_vec3(c: canvas.Canvas, xform: WorldToPage, pts) -> None:
-    if len(pts) < 2:
-        return
-    x0, y0 = xform.w2p(pts[0].x, pts[0].y)
-    path = c.beginPath()
-    path.moveTo(x0, y0)
-    for v in pts[1:]:
-        xp, yp = xform.w2p(v.x, v.y)
-        path.lineTo(xp, yp)
-    c.drawPath(path)
+# Flattenings with fewer points are drawn as-is: the simplification pass
+# costs more than the points it could drop.
+_SIMPLIFY_MIN_POINTS = 64
 
 
-def entity_bbox_wu(
-    e,
-    *,
-    scale_wu_to_pt: Optional[float] = None,
-    spline_flatten_mm: float = 0.5,
-) -> Optional[Tuple[float, float, float, float]]:
-    """Return (minx, miny, maxx, maxy) in DXF world units for supported entities.
-
-    Notes:
-        - SPLINE and ELLIPSE entities are approximated by flattening into short line segments.
-        - For flattened curves we need `scale_wu_to_pt` so the flattening tolerance can be
-            expressed as a physical distance (mm) on paper.
+def _simplify_polyline(pts: np.ndarray, tolerance: float) -> np.ndarray:
+    """Drop near-collinear interior points of an (N, 2) polyline in one pass.
+
+    A point goes if it lies within `tolerance` (world units) of the segment
+    between its neighbours. Of consecutive such points only every other one
+    is dropped, so each dropped point's neighbours stay and the result is
+    within `tolerance` of the input.
+    """
+    if len(pts) < 3:
+        return pts
+    a = pts[:-2]
+    seg = pts[2:] - a
+    rel = pts[1:-1] - a
+    seg_len2 = np.einsum("ij,ij->i", seg, seg)
+    # Distance to the segment, not the infinite line: a point past either
+    # end (e.g. a hairpin tip) must not look collinear.
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = np.clip(np.einsum("ij,ij->i", rel, seg) / seg_len2, 0.0, 1.0)
+    t[seg_len2 == 0.0] = 0.0  # closed run: measure from the shared end point
+    rel -= t[:, None] * seg
+    near = np.hypot(rel[:, 0], rel[:, 1]) <= tolerance
+    # Drop the 1st, 3rd, ... point of each run of near-collinear points.
+    idx = np.arange(len(near))
+    run_start = np.maximum.accumulate(np.where(near, 0, idx + 1))
+    keep = np.ones(len(pts), dtype=bool)
+    keep[1:-1] = ~near | ((idx - run_start) % 2 == 1)
+    return pts[keep]
+
+
+def transform_xy(
+    pts_wu: np.ndarray, scale: float, tx: float, ty: float, out: np.ndarray
+) -> np.ndarray:
+    """Map (N, 2) world points to a flat [x0, y0, x1, y1, ...] array in points.
+
+    Writes into `out` (length 2N) as page = world * scale + (tx, ty) and
+    returns it. `use_jit_transform` compiles an equivalent `_jit_transform`,
+    which the drawers use instead when it is set.
     """
-    t = e.dxftype()
+    out[0::2] = pts_wu[:, 0] * scale + tx
+    out[1::2] = pts_wu[:, 1] * scale + ty
+    return out
+
+
+def _transform_xy_loop(pts_wu, scale, tx, ty, out):
+    for i in range(pts_wu.shape[0]):
+        out[2 * i] = pts_wu[i, 0] * scale + tx
+        out[2 * i + 1] = pts_wu[i, 1] * scale + ty
+    return out
+
+
+def _path_ops_loop(flat_xy, closed, run):
+    """Format [x0, y0, x1, y1, ...] as ASCII "x y m / x y l ... S" path operators.
+
+    Every `run` points start a new subpath (`run` = point count for a single
+    polyline, 2 for separate segments). Same output as the `%d` formatting in
+    `emit_polyline` / `emit_segments` (coordinates rounded half-to-even),
+    written digit by digit into a uint8 buffer.
+    """
+    n = flat_xy.shape[0] // 2
+    # Up to 20 digits and a sign per int64 coordinate, plus "  m\n".
+    buf = np.empty(n * 46 + 4, dtype=np.uint8)
+    pos = 0
+    for i in range(n):
+        for k in range(2):
+            v = np.int64(np.rint(flat_xy[2 * i + k]))
+            if v < 0:
+                buf[pos] = 45  # "-"
+                pos += 1
+                v = -v
+            start = pos
+            while True:
+                buf[pos] = 48 + v % 10
+                pos += 1
+                v //= 10
+                if v == 0:
+                    break
+            a, b = start, pos - 1
+            while a < b:  # digits were written least significant first
+                buf[a], buf[b] = buf[b], buf[a]
+                a += 1
+                b -= 1
+            buf[pos] = 32  # " "
+            pos += 1
+        buf[pos] = 109 if i % run == 0 else 108  # "m" / "l"
+        buf[pos + 1] = 10
+        pos += 2
+    if closed:
+        buf[pos] = 104  # "h S"
+        buf[pos + 1] = 32
+        pos += 2
+    buf[pos] = 83
+    return buf[:pos + 1]
+
+
+# Numba-compiled `_transform_xy_loop` and `_path_ops_loop`, set by
+# `use_jit_transform`.
+_jit_transform = None
+_jit_path_ops = None
+
+
+def use_jit_transform() -> bool:
+    """Enable Numba-compiled drawing kernels (`--numba`).
+
+    Compiles `_transform_xy_loop` and `_path_ops_loop` into `_jit_transform`
+    and `_jit_path_ops`, which the drawers and `emit_polyline` use when set.
+    Compiles both up front so the JIT cost isn't paid mid-render. Returns
+    False if numba isn't installed, leaving the NumPy versions in use.
+    """
+    global _jit_transform, _jit_path_ops
     try:
-        if t == "LINE":
-            p1 = e.dxf.start
-            p2 = e.dxf.end
-            xs = [p1.x, p2.x]
-            ys = [p1.y, p2.y]
-            return min(xs), min(ys), max(xs), max(ys)
-
-        if t in ("LWPOLYLINE",):
-            pts = [Vec2(p[0], p[1]) for p in e.get_points("xy")]
-            xs = [p.x for p in pts]
-            ys = [p.y for p in pts]
-            return min(xs), min(ys), max(xs), max(ys)
-
-        if t in ("POLYLINE",):
-            pts = [Vec2(v.dxf.location.x, v.dxf.location.y)
-                   for v in e.vertices()]
-            if not pts:
-                return None
-            xs = [p.x for p in pts]
-            ys = [p.y for p in pts]
-            return min(xs), min(ys), max(xs), max(ys)
-
-        if t == "CIRCLE":
-            c = e.dxf.center
-            r = float(e.dxf.radius)
-            return c.x - r, c.y - r, c.x + r, c.y + r
-
-        if t == "ARC":
-            c = e.dxf.center
-            r = float(e.dxf.radius)
-            # Conservative bbox: full circle bounds (fast + safe)
-            return c.x - r, c.y - r, c.x + r, c.y + r
-
-        if t == "POINT":
-            p = e.dxf.location
-            return p.x, p.y, p.x, p.y
-
-        if t == "SPLINE":
-            pts = _flatten_path_entity_points(
-                e, scale_wu_to_pt=scale_wu_to_pt, flatten_mm=spline_flatten_mm
-            )
-            if not pts:
-                return None
-            xs = [v.x for v in pts]
-            ys = [v.y for v in pts]
-            return min(xs), min(ys), max(xs), max(ys)
-
-        if t == "ELLIPSE":
-            pts = _flatten_path_entity_points(
-                e, scale_wu_to_pt=scale_wu_to_pt, flatten_mm=spline_flatten_mm
+        from numba import njit
+    except ImportError:
+        return False
+    _jit_transform = njit(cache=True, fastmath=True)(_transform_xy_loop)
+    _jit_transform(np.zeros((1, 2)), 1.0, 0.0, 0.0, np.empty(2))
+    _jit_path_ops = njit(cache=True)(_path_ops_loop)
+    _jit_path_ops(np.zeros(4), False, 2)
+    return True
+
+
+def begin_path_units(c: canvas.Canvas) -> None:
+    """Save state and scale the CTM so one unit is 1/PATH_UNITS_PER_PT point.
+
+    Entity geometry is drawn in these units (see `emit_polyline`); the line
+    width is set to 1 pt. Pair with `c.restoreState()`.
+    """
+    c.saveState()
+    c.scale(1.0 / PATH_UNITS_PER_PT, 1.0 / PATH_UNITS_PER_PT)
+    c.setLineWidth(PATH_UNITS_PER_PT)
+
+
+def emit_polyline(c: canvas.Canvas, flat_xy: np.ndarray, closed: bool = False) -> None:
+    """Append a stroked polyline to the page as raw PDF path operators.
+
+    `flat_xy` is [x0, y0, x1, y1, ...] in path units (inside
+    `begin_path_units`). Coordinates are rounded to integers, i.e. 0.01 pt,
+    and written with a single `%d` format operation: integer formatting is
+    much cheaper than `%.2f`, and it skips ReportLab's path object (one
+    Python call per vertex).
+    """
+    n = len(flat_xy) // 2
+    if n < 2:
+        return
+    if _jit_path_ops is not None:
+        c._code.append(_jit_path_ops(flat_xy, closed, n).tobytes().decode("ascii"))
+        return
+    q = np.rint(flat_xy).astype(np.int64)
+    ops = "%d %d m\n" + "%d %d l\n" * (n - 1) + ("h S" if closed else "S")
+    c._code.append(ops % tuple(q.tolist()))
+
+
+def emit_segments(c: canvas.Canvas, flat_xy: np.ndarray) -> None:
+    """Append separate two-point segments as one stroked path.
+
+    `flat_xy` is [ax0, ay0, bx0, by0, ax1, ...] in path units; formatted like
+    `emit_polyline`, with one "m"/"l" pair per segment and a single "S".
+    """
+    n = len(flat_xy) // 4
+    if not n:
+        return
+    if _jit_path_ops is not None:
+        c._code.append(_jit_path_ops(flat_xy, False, 2).tobytes().decode("ascii"))
+        return
+    q = np.rint(flat_xy).astype(np.int64)
+    c._code.append(("%d %d m\n%d %d l\n" * n + "S") % tuple(q.tolist()))
+
+
+# Bezier control-point distance for a quarter circle, as a fraction of r.
+_KAPPA = 4.0 * (math.sqrt(2.0) - 1.0) / 3.0
+
+
+def emit_dot(c: canvas.Canvas, x: float, y: float, r: float) -> None:
+    """Append a filled circle (four Bezier quadrants) as raw path operators.
+
+    Same integer path units as `emit_polyline`; replaces `c.circle`, which
+    builds a ReportLab path object for every dot.
+    """
+    k = r * _KAPPA
+    c._code.append(
+        "%d %d m\n%d %d %d %d %d %d c\n%d %d %d %d %d %d c\n"
+        "%d %d %d %d %d %d c\n%d %d %d %d %d %d c\nh f" % tuple(
+            round(v) for v in (
+                x + r, y,
+                x + r, y + k, x + k, y + r, x, y + r,
+                x - k, y + r, x - r, y + k, x - r, y,
+                x - r, y - k, x - k, y - r, x, y - r,
+                x + k, y - r, x + r, y - k, x + r, y,
             )
-            if not pts:
-                return None
-            xs = [v.x for v in pts]
-            ys = [v.y for v in pts]
-            return min(xs), min(ys), max(xs), max(ys)
+        )
+    )
 
-        print(
-            f"Warning: Unsupported entity type '{t}' for bounding box; skipping.")
 
-        # Add more types as needed (ELLIPSE, SPLINE, etc.)
-        return None
-    except Exception:
-        return None
+# Output buffer for transform_xy, grown on demand and reused for every
+# entity: path operators are formatted from it before the next transform.
+_xy_scratch = np.empty(4096, dtype=np.float64)
+
+
+def xy_scratch(size: int) -> np.ndarray:
+    """Return a reusable float64 buffer of length `size` for `transform_xy`."""
+    global _xy_scratch
+    if len(_xy_scratch) < size:
+        _xy_scratch = np.empty(max(size, 2 * len(_xy_scratch)), dtype=np.float64)
+    return _xy_scratch[:size]
+
+
+def _draw_polyline(
+    c: canvas.Canvas,
+    affine: Tuple[float, float, float],
+    pts: np.ndarray,
+    closed: bool = False,
+) -> None:
+    n = len(pts)
+    if n < 2:
+        return
+    xy = _jit_transform if _jit_transform is not None else transform_xy
+    flat = xy(pts, *affine, xy_scratch(2 * n))
+    emit_polyline(c, flat, closed)
+
+
+def _sample_arc_points(
+    cx: float,
+    cy: float,
+    r: float,
+    start_deg: float,
+    end_deg: float,
+    *,
+    scale_wu_to_pt: float,
+    tolerance_mm: float = 0.025,
+) -> np.ndarray:
+    """Sample a DXF arc into an (N, 2) array of world points.
+
+    DXF arcs sweep CCW from start_deg to end_deg. The segment count keeps the
+    chord error (sagitta) on paper below tolerance_mm, with at least 8 segments.
+    The trig is shared between arcs with the same angles and segment count.
+    """
+    if end_deg < start_deg:
+        end_deg += 360.0 * math.ceil((start_deg - end_deg) / 360.0)
+    sweep = math.radians(end_deg - start_deg)
+    r_pt = r * scale_wu_to_pt
+    tol_pt = tolerance_mm * mm
+    max_step = 2.0 * math.acos(1.0 - tol_pt / r_pt) if r_pt > tol_pt else math.pi / 4
+    n = max(8, math.ceil(sweep / max_step))
+    return _unit_arc_points(start_deg, end_deg, n) * r + (cx, cy)
+
 
+@functools.lru_cache(maxsize=1024)
+def _unit_arc_points(start_deg: float, end_deg: float, n: int) -> np.ndarray:
+    """(n + 1, 2) cos/sin of n equal steps from start_deg to end_deg (read-only)."""
+    thetas = np.linspace(math.radians(start_deg), math.radians(end_deg), n + 1)
+    unit = np.column_stack((np.cos(thetas), np.sin(thetas)))
+    unit.flags.writeable = False
+    return unit
 
-def drawing_bbox_wu(
+
+def _points_bbox(pts: np.ndarray) -> Tuple[float, float, float, float]:
+    mins = pts.min(axis=0)
+    maxs = pts.max(axis=0)
+    return float(mins[0]), float(mins[1]), float(maxs[0]), float(maxs[1])
+
+
+def prepare_entities(
     ents: Iterable,
     *,
-    scale_wu_to_pt: Optional[float] = None,
-    spline_flatten_mm: float = 0.5,
+    scale_wu_to_pt: float,
+    doc: Optional[ezdxf.EzdxfDocument] = None,
+    flatten_mm: float = 0.5,
+) -> List[PreparedEntity]:
+    """Extract drawable geometry from DXF entities once, ahead of tiling.
+
+    Curves are flattened with the same tolerance the renderer used to apply
+    per tile, so drawing a prepared record on each page costs only the
+    world->page transform. Unsupported or degenerate entities are dropped.
+    """
+    prepared: List[PreparedEntity] = []
+    # (entity linetype, layer) -> (continuous, dash). Patterns usually use a
+    # handful of linetypes, so the layer/linetype table lookups run once each.
+    linetypes: dict = {}
+    for e in ents:
+        t = e.dxftype()
+        try:
+            if t == "LINE":
+                p1 = e.dxf.start
+                p2 = e.dxf.end
+                pts = np.array(((p1.x, p1.y), (p2.x, p2.y)), dtype=np.float64)
+                rec = PreparedEntity(t, _points_bbox(pts), pts_wu=pts)
+            elif t in ("LWPOLYLINE", "POLYLINE"):
+                if t == "LWPOLYLINE":
+                    pts = np.array(list(e.get_points("xy")), dtype=np.float64)
+                    closed = bool(e.closed)
+                else:
+                    pts = np.array([(v.x, v.y) for v in e.points()],
+                                   dtype=np.float64)
+                    closed = bool(e.is_closed)
+                if not pts.size:
+                    continue
+                pts = pts.reshape(-1, 2)
+                rec = PreparedEntity(t, _points_bbox(pts), pts_wu=pts,
+                                     closed=closed)
+            elif t in ("CIRCLE", "ARC"):
+                cc = e.dxf.center
+                r = float(e.dxf.radius)
+                if t == "CIRCLE":
+                    # Drop the repeated end point; the path is closed instead.
+                    pts = _sample_arc_points(
+                        cc.x, cc.y, r, 0.0, 360.0, scale_wu_to_pt=scale_wu_to_pt
+                    )[:-1]
+                else:
+                    pts = _sample_arc_points(
+                        cc.x, cc.y, r,
+                        float(e.dxf.start_angle), float(e.dxf.end_angle),
+                        scale_wu_to_pt=scale_wu_to_pt,
+                    )
+                # ARC keeps the full circle bounds (fast + conservative)
+                rec = PreparedEntity(
+                    t,
+                    (cc.x - r, cc.y - r, cc.x + r, cc.y + r),
+                    pts_wu=pts,
+                    closed=(t == "CIRCLE"),
+                )
+            elif t == "POINT":
+                p = e.dxf.location
+                rec = PreparedEntity(t, (p.x, p.y, p.x, p.y), center=(p.x, p.y))
+            elif t in ("SPLINE", "ELLIPSE"):
+                pts = _flatten_path_entity_points(
+                    e, scale_wu_to_pt=scale_wu_to_pt, flatten_mm=flatten_mm
+                )
+                if len(pts) < 2:
+                    continue
+                rec = PreparedEntity(t, _points_bbox(pts), pts_wu=pts)
+            else:
+                print(
+                    f"Warning: Unsupported entity type '{t}' for bounding box; skipping.")
+                continue
+        except Exception:
+            continue
+
+        if doc is not None:
+            key = (getattr(e.dxf, "linetype", None), getattr(e.dxf, "layer", "0"))
+            lt = linetypes.get(key)
+            if lt is None:
+                lt_name = _effective_linetype_name(doc, e)
+                lt = linetypes[key] = (
+                    _linetype_name_is_continuous(lt_name),
+                    _reportlab_dash_array_for_linetype(
+                        doc, lt_name, scale_wu_to_pt=scale_wu_to_pt
+                    ),
+                )
+            rec.continuous, rec.dash = lt
+        prepared.append(rec)
+    return prepared
+
+
+def prepared_bbox_wu(
+    prepared: List[PreparedEntity],
 ) -> Tuple[float, float, float, float]:
-    bbs = [
-        entity_bbox_wu(e, scale_wu_to_pt=scale_wu_to_pt,
-                       spline_flatten_mm=spline_flatten_mm)
-        for e in ents
-    ]
-    bbs = [bb for bb in bbs if bb is not None]
-    if not bbs:
+    """Drawing bbox (minx, miny, maxx, maxy) in world units.
+
+    Reduces the per-entity bboxes computed by `prepare_entities`, so the
+    entities are never re-read or re-flattened.
+    """
+    if not prepared:
         raise ValueError(
             "No supported geometry found in DXF (LINE/LWPOLYLINE/SPLINE/etc.).")
-    minx = min(bb[0] for bb in bbs)
-    miny = min(bb[1] for bb in bbs)
-    maxx = max(bb[2] for bb in bbs)
-    maxy = max(bb[3] for bb in bbs)
-    return minx, miny, maxx, maxy
+    bbs = np.array([rec.bbox for rec in prepared], dtype=np.float64)
+    mins = bbs[:, :2].min(axis=0)
+    maxs = bbs[:, 2:].max(axis=0)
+    return float(mins[0]), float(mins[1]), float(maxs[0]), float(maxs[1])
 
 # ----------------------------
 # PDF drawing primitives
 # ----------------------------
 
 
+@functools.lru_cache(maxsize=None)
+def _state_tracking_canvas_class():
+    from reportlab.pdfgen import canvas
+
+    class StateTrackingCanvas(canvas.Canvas):
+        """Canvas that drops setFont/setLineWidth calls repeating the current state.
+
+        Only state already written to the current content stream counts: it starts
+        empty on every page (and form) and follows saveState/restoreState (q/Q),
+        so a skipped call never relies on a value the PDF doesn't have.
+        """
+
+        def __init__(self, *args, **kwargs):
+            self._emitted: dict = {}
+            self._emitted_stack: List[dict] = []
+            super().__init__(*args, **kwargs)
+
+        def setFont(self, psfontname, size, leading=None):
+            key = (psfontname, size, size * 1.2 if leading is None else leading)
+            if self._emitted.get("font") == key:
+                return
+            super().setFont(psfontname, size, leading)
+            self._emitted["font"] = key
+
+        def setLineWidth(self, width):
+            if self._emitted.get("line_width") == width:
+                return
+            super().setLineWidth(width)
+            self._emitted["line_width"] = width
+
+        def saveState(self):
+            super().saveState()
+            self._emitted_stack.append(dict(self._emitted))
+
+        def restoreState(self):
+            super().restoreState()
+            self._emitted = self._emitted_stack.pop()
+
+        def showPage(self):
+            super().showPage()
+            self._emitted = {}
+            self._emitted_stack = []
+
+        def beginForm(self, *args, **kwargs):
+            super().beginForm(*args, **kwargs)
+            self._emitted_stack.append(self._emitted)
+            self._emitted = {}
+
+        def endForm(self, **extra_attributes):
+            super().endForm(**extra_attributes)
+            self._emitted = self._emitted_stack.pop()
+
+    return StateTrackingCanvas
+
+
+def new_canvas(*args, **kwargs) -> canvas.Canvas:
+    """Create a StateTrackingCanvas (takes the same arguments as Canvas).
+
+    The class is built on first use so reportlab.pdfgen is only imported
+    when something is actually rendered.
+    """
+    return _state_tracking_canvas_class()(*args, **kwargs)
+
+
 def draw_edge_alignment_dashed_line(
     c: canvas.Canvas,
     *,
@@ -304,7 +809,7 @@ def draw_edge_alignment_dashed_line(
     - seam_y_pt: draws a horizontal dashed line at y=seam_y_pt
 
     Lines are inset from paper edges by inset_pt so they remain visible after
-    overlapping pages.
+    overlapping pages. When both are given they are stroked as one path.
     """
     c.saveState()
     try:
@@ -312,147 +817,333 @@ def draw_edge_alignment_dashed_line(
         c.setLineCap(1)  # round cap => short dashes look like dots
         c.setDash(dash_on_pt, dash_off_pt)
 
+        segs = []
         if seam_x_pt is not None:
-            c.line(seam_x_pt, inset_pt, seam_x_pt, page_h_pt - inset_pt)
+            segs.append((seam_x_pt, inset_pt, seam_x_pt, page_h_pt - inset_pt))
 
         if seam_y_pt is not None:
-            c.line(inset_pt, seam_y_pt, page_w_pt - inset_pt, seam_y_pt)
+            segs.append((inset_pt, seam_y_pt, page_w_pt - inset_pt, seam_y_pt))
+
+        if segs:
+            c.lines(segs)
     finally:
         c.restoreState()
 
 
 def draw_crop_marks(c: canvas.Canvas, x0: float, y0: float, x1: float, y1: float, len_pt: float = 6*mm):
-    """Crop marks at the corners of a rectangle."""
-    # bottom-left
-    c.line(x0, y0, x0 + len_pt, y0)
-    c.line(x0, y0, x0, y0 + len_pt)
-    # bottom-right
-    c.line(x1, y0, x1 - len_pt, y0)
-    c.line(x1, y0, x1, y0 + len_pt)
-    # top-left
-    c.line(x0, y1, x0 + len_pt, y1)
-    c.line(x0, y1, x0, y1 - len_pt)
-    # top-right
-    c.line(x1, y1, x1 - len_pt, y1)
-    c.line(x1, y1, x1, y1 - len_pt)
+    """Crop marks at the corners of a rectangle (stroked as one path)."""
+    c.lines([
+        # bottom-left
+        (x0, y0, x0 + len_pt, y0),
+        (x0, y0, x0, y0 + len_pt),
+        # bottom-right
+        (x1, y0, x1 - len_pt, y0),
+        (x1, y0, x1, y0 + len_pt),
+        # top-left
+        (x0, y1, x0 + len_pt, y1),
+        (x0, y1, x0, y1 - len_pt),
+        # top-right
+        (x1, y1, x1 - len_pt, y1),
+        (x1, y1, x1, y1 - len_pt),
+    ])
 
 
 def draw_scale_bar(c: canvas.Canvas, x: float, y: float, length_mm: float = 100.0):
     """Draw a 100mm scale bar by default."""
     length_pt = length_mm * mm
     c.setLineWidth(1)
-    c.line(x, y, x + length_pt, y)
-    c.line(x, y - 2*mm, x, y + 2*mm)
-    c.line(x + length_pt, y - 2*mm, x + length_pt, y + 2*mm)
+    c.lines([
+        (x, y, x + length_pt, y),
+        (x, y - 2*mm, x, y + 2*mm),
+        (x + length_pt, y - 2*mm, x + length_pt, y + 2*mm),
+    ])
     c.setFont("Helvetica", 8)
     c.drawString(x, y + 3*mm, f"{int(length_mm)} mm scale bar")
 
 
-def draw_entity(
+def _liang_barsky(
+    p0: np.ndarray, d: np.ndarray, rect: Tuple[float, float, float, float]
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Clip segments p0 + t*d (t in [0, 1]) to rect, all at once.
+
+    Returns (keep, t0, t1): the visible part of segment k is t0[k]..t1[k]
+    where keep[k] is True. Unclipped ends keep t0 == 0 / t1 == 1 exactly.
+    Segments that only touch the rect at a point (t0 == t1) are dropped.
+    """
+    xmin, ymin, xmax, ymax = rect
+    t0 = np.zeros(len(p0))
+    t1 = np.ones(len(p0))
+    keep = np.ones(len(p0), dtype=bool)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for p, q in ((-d[:, 0], p0[:, 0] - xmin), (d[:, 0], xmax - p0[:, 0]),
+                     (-d[:, 1], p0[:, 1] - ymin), (d[:, 1], ymax - p0[:, 1])):
+            keep &= (p != 0) | (q >= 0)  # parallel to this edge and outside
+            r = q / p
+            t0 = np.where(p < 0, np.maximum(t0, r), t0)
+            t1 = np.where(p > 0, np.minimum(t1, r), t1)
+    keep &= t0 < t1
+    return keep, t0, t1
+
+
+def _clip_endpoints(
+    p0: np.ndarray, p1: np.ndarray, t0: np.ndarray, t1: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Clipped segment ends; unclipped ends are the original points bit for bit."""
+    d = p1 - p0
+    a = np.where((t0 == 0.0)[:, None], p0, p0 + t0[:, None] * d)
+    b = np.where((t1 == 1.0)[:, None], p1, p0 + t1[:, None] * d)
+    return a, b
+
+
+def clip_polyline_to_rect(
+    pts: np.ndarray,
+    rect: Tuple[float, float, float, float],
+    closed: bool = False,
+) -> List[np.ndarray]:
+    """Clip an (N, 2) polyline to rect = (minx, miny, maxx, maxy).
+
+    Returns the visible pieces as open polylines (empty if nothing is
+    inside). A closed polyline's closing segment is clipped too.
+    """
+    if closed:
+        pts = np.concatenate((pts, pts[:1]))
+    p0, p1 = pts[:-1], pts[1:]
+    keep, t0, t1 = _liang_barsky(p0, p1 - p0, rect)
+    ks = np.flatnonzero(keep)
+    if not len(ks):
+        return []
+    a, b = _clip_endpoints(p0, p1, t0, t1)
+    # Consecutive visible segments that share an unclipped vertex form one piece.
+    joined = (ks[1:] == ks[:-1] + 1) & (t1[ks[:-1]] == 1.0) & (t0[ks[1:]] == 0.0)
+    pieces = [np.concatenate((a[run[:1]], b[run]))
+              for run in np.split(ks, np.flatnonzero(~joined) + 1)]
+    if (closed and len(pieces) > 1 and ks[0] == 0 and ks[-1] == len(p0) - 1
+            and t0[0] == 0.0 and t1[-1] == 1.0):
+        # The last piece runs through the start vertex into the first one.
+        pieces[0] = np.concatenate((pieces.pop(), pieces[0][1:]))
+    return pieces
+
+
+def emit_clip_rect(
+    c: canvas.Canvas,
+    affine: Tuple[float, float, float],
+    rect: Tuple[float, float, float, float],
+) -> None:
+    """Intersect the clip path with rect = (minx, miny, maxx, maxy) in world units.
+
+    Raw "re W n" in the integer path units of `emit_polyline`. Dashed strokes
+    are clipped this way rather than cut with `clip_polyline_to_rect`: a cut
+    stroke would restart its dash pattern at the tile edge.
+    """
+    s, tx, ty = affine
+    x0, y0 = round(rect[0] * s + tx), round(rect[1] * s + ty)
+    x1, y1 = round(rect[2] * s + tx), round(rect[3] * s + ty)
+    c._code.append("%d %d %d %d re W n" % (x0, y0, x1 - x0, y1 - y0))
+
+
+def _draw_polyline_records(
     c: canvas.Canvas,
-    e,
-    xform: WorldToPage,
-    *,
-    doc: Optional[ezdxf.EzdxfDocument] = None,
-    exclude_noncontinuous_linetypes: bool = False,
-):
-    t = e.dxftype()
+    ents: EntityArrays,
+    ks: np.ndarray,
+    affine: Tuple[float, float, float],
+    clip_rect: Optional[Tuple[float, float, float, float]],
+) -> None:
+    """Stroke rows drawn from their vertices (everything but POINT).
+
+    Rows are drawn grouped by dash pattern: solid rows need no graphics state
+    change at all, and each dashed group gets one save/setDash/restore.
+    Solid rows whose bbox isn't entirely inside `clip_rect` are clipped to it;
+    dashed groups are drawn whole under an `emit_clip_rect` clip path.
+    """
+    u = PATH_UNITS_PER_PT
+    pts = ents.pts_wu
+    dashes = ents.dashes
+    ks = ks[np.argsort(ents.dash_ids[ks], kind="stable")]
+    if clip_rect is None:
+        inside = [True] * len(ks)
+    else:
+        bb = ents.bbox[ks]
+        inside = ((bb[:, 0] >= clip_rect[0]) & (bb[:, 1] >= clip_rect[1]) &
+                  (bb[:, 2] <= clip_rect[2]) & (bb[:, 3] <= clip_rect[3])).tolist()
+    current = 0  # dash id in effect (0 = solid, the state on entry)
+    for a, b, closed, d, fits in zip(ents.offsets[ks].tolist(),
+                                     ents.offsets[ks + 1].tolist(),
+                                     ents.closed[ks].tolist(),
+                                     ents.dash_ids[ks].tolist(),
+                                     inside):
+        if fits or d:
+            pieces = None
+        else:
+            pieces = clip_polyline_to_rect(pts[a:b], clip_rect, closed)
+            if not pieces:
+                continue
+        if d != current:
+            if current:
+                c.restoreState()
+            if d:
+                c.saveState()
+                if clip_rect is not None:
+                    emit_clip_rect(c, affine, clip_rect)
+                c.setDash([v * u for v in dashes[d]], 0)
+            current = d
+        if pieces is None:
+            _draw_polyline(c, affine, pts[a:b], closed=closed)
+        else:
+            for piece in pieces:
+                _draw_polyline(c, affine, piece)
+    if current:
+        c.restoreState()
+
+
+def _draw_line_records(
+    c: canvas.Canvas,
+    ents: EntityArrays,
+    ks: np.ndarray,
+    affine: Tuple[float, float, float],
+    clip_rect: Optional[Tuple[float, float, float, float]],
+) -> None:
+    """Stroke LINE rows as one path per dash pattern, clipped to `clip_rect`.
+
+    Lines are usually the most numerous entities; this replaces a path,
+    stroke and save/restore per line with one per linetype. Solid lines are
+    cut to `clip_rect`, dashed ones clipped with `emit_clip_rect`.
+    """
+    ids = ents.dash_ids[ks]
+    uniq, first = np.unique(ids, return_index=True)
+    u = PATH_UNITS_PER_PT
+    for d in uniq[np.argsort(first)].tolist():
+        # Both endpoints of every line in the group, gathered in one step.
+        starts = ents.offsets[ks[ids == d]]
+        pts = ents.pts_wu[(starts[:, None] + (0, 1)).ravel()]
+        if clip_rect is not None and not d:
+            p0, p1 = pts[0::2], pts[1::2]
+            keep, t0, t1 = _liang_barsky(p0, p1 - p0, clip_rect)
+            if not keep.any():
+                continue
+            a, b = _clip_endpoints(p0[keep], p1[keep], t0[keep], t1[keep])
+            pts = np.stack((a, b), axis=1).reshape(-1, 2)
+        xy = _jit_transform if _jit_transform is not None else transform_xy
+        flat = xy(pts, *affine, xy_scratch(2 * len(pts)))
+        if d:
+            c.saveState()
+            if clip_rect is not None:
+                emit_clip_rect(c, affine, clip_rect)
+            c.setDash([v * u for v in ents.dashes[d]], 0)
+            emit_segments(c, flat)
+            c.restoreState()
+        else:
+            emit_segments(c, flat)
+
+
+def _draw_point_records(
+    c: canvas.Canvas,
+    ents: EntityArrays,
+    ks: np.ndarray,
+    affine: Tuple[float, float, float],
+    clip_rect: Optional[Tuple[float, float, float, float]],
+) -> None:
+    """Fill POINT rows as small dots (dash patterns don't apply to fills)."""
+    scale, tx, ty = affine
+    # Render as a small filled dot in physical units.
+    r = 0.4 * mm * PATH_UNITS_PER_PT
+    for x, y in ents.pts_wu[ents.offsets[ks]].tolist():
+        emit_dot(c, x * scale + tx, y * scale + ty, r)
+
+
+_RECORD_DRAWERS = {
+    "LINE": _draw_line_records,
+    "LWPOLYLINE": _draw_polyline_records,
+    "POLYLINE": _draw_polyline_records,
+    "CIRCLE": _draw_polyline_records,
+    "ARC": _draw_polyline_records,
+    "SPLINE": _draw_polyline_records,
+    "ELLIPSE": _draw_polyline_records,
+    "POINT": _draw_point_records,
+}
+
+
+def indices_by_type(ents: EntityArrays) -> dict:
+    """Partition all rows of `ents` as {dxftype: [k, ...]}."""
+    by_type: dict = {}
+    names = ents.type_names
+    for k, tid in enumerate(ents.type_ids.tolist()):
+        by_type.setdefault(names[tid], []).append(k)
+    return by_type
+
+
+def draw_entities(
+    c: canvas.Canvas,
+    ents: EntityArrays,
+    by_type: dict,
+    affine: Tuple[float, float, float],
+    clip_rect: Optional[Tuple[float, float, float, float]] = None,
+) -> None:
+    """Draw entity rows inside `begin_path_units`, one type bucket at a time.
+
+    `by_type` maps dxftype to row indices (a `TileJob.grid` cell or
+    `indices_by_type`); each bucket goes to its type's drawer, so there is no
+    per-row dispatch. `affine` comes from `WorldToPage.affine(PATH_UNITS_PER_PT)`.
+    Stroked geometry is clipped to `clip_rect` (world units) if given.
+    """
+    for t, ks in by_type.items():
+        _RECORD_DRAWERS[t](c, ents, np.asarray(ks, dtype=np.intp), affine, clip_rect)
 
-    lt_name: Optional[str] = None
-    dash: Optional[List[float]] = None
-    if doc is not None:
-        lt_name = _effective_linetype_name(doc, e)
-        if exclude_noncontinuous_linetypes and not _linetype_name_is_continuous(lt_name):
-            return
-        dash = _reportlab_dash_array_for_linetype(
-            doc, lt_name, scale_wu_to_pt=xform.scale_wu_to_pt
-        )
 
+def draw_pattern_form(
+    c: canvas.Canvas,
+    ents: EntityArrays,
+    *,
+    bbox: Tuple[float, float, float, float],
+    scale_wu_to_pt: float,
+    name: str = "pattern",
+) -> None:
+    """Draw every entity once into a PDF form XObject named `name`.
+
+    The form is at 1:1 scale with the drawing's (minx, miny) at its origin, so
+    a tile shows it with a plain translation (see `place_pattern_form`).
+    Must be called before anything is drawn on the first page.
+    """
+    minx, miny, maxx, maxy = bbox
+    pad_pt = 2.0  # room for stroke width at the bbox edges
+    c.beginForm(
+        name,
+        lowerx=-pad_pt,
+        lowery=-pad_pt,
+        upperx=(maxx - minx) * scale_wu_to_pt + pad_pt,
+        uppery=(maxy - miny) * scale_wu_to_pt + pad_pt,
+    )
+    affine = WorldToPage(
+        scale_wu_to_pt=scale_wu_to_pt,
+        world_x0=minx,
+        world_y0=miny,
+        page_x0_pt=0.0,
+        page_y0_pt=0.0,
+    ).affine(PATH_UNITS_PER_PT)
+    begin_path_units(c)
+    draw_entities(c, ents, indices_by_type(ents), affine)
+    c.restoreState()
+    c.endForm()
+
+
+def place_pattern_form(
+    c: canvas.Canvas,
+    *,
+    x_pt: float,
+    y_pt: float,
+    clip_rect_pt: Tuple[float, float, float, float],
+    name: str = "pattern",
+) -> None:
+    """Show the form from `draw_pattern_form` with its origin at (x_pt, y_pt).
+
+    Output is clipped to clip_rect_pt = (x, y, width, height).
+    """
     c.saveState()
     try:
-        if dash:
-            c.setDash(dash, 0)
-
-        if t == "LINE":
-            p1 = e.dxf.start
-            p2 = e.dxf.end
-            x1, y1 = xform.w2p(p1.x, p1.y)
-            x2, y2 = xform.w2p(p2.x, p2.y)
-            c.line(x1, y1, x2, y2)
-            return
-
-        if t == "LWPOLYLINE":
-            pts = [(p[0], p[1]) for p in e.get_points("xy")]
-            if not pts:
-                return
-            p0 = pts[0]
-            x0, y0 = xform.w2p(p0[0], p0[1])
-            path = c.beginPath()
-            path.moveTo(x0, y0)
-            for (xw, yw) in pts[1:]:
-                xp, yp = xform.w2p(xw, yw)
-                path.lineTo(xp, yp)
-            if e.closed:
-                path.close()
-            c.drawPath(path)
-            return
-
-        if t == "POLYLINE":
-            pts = [(v.dxf.location.x, v.dxf.location.y) for v in e.vertices()]
-            if not pts:
-                return
-            x0, y0 = xform.w2p(pts[0][0], pts[0][1])
-            path = c.beginPath()
-            path.moveTo(x0, y0)
-            for (xw, yw) in pts[1:]:
-                xp, yp = xform.w2p(xw, yw)
-                path.lineTo(xp, yp)
-            if e.is_closed:
-                path.close()
-            c.drawPath(path)
-            return
-
-        if t == "CIRCLE":
-            cc = e.dxf.center
-            r = float(e.dxf.radius)
-            x, y = xform.w2p(cc.x, cc.y)
-            r_pt = r * xform.scale_wu_to_pt
-            c.circle(x, y, r_pt)
-            return
-
-        if t == "ARC":
-            cc = e.dxf.center
-            r = float(e.dxf.radius)
-            start = float(e.dxf.start_angle)
-            end = float(e.dxf.end_angle)
-            # reportlab uses degrees CCW from +x, same convention
-            x, y = xform.w2p(cc.x, cc.y)
-            r_pt = r * xform.scale_wu_to_pt
-            c.arc(x - r_pt, y - r_pt, x + r_pt, y + r_pt,
-                  startAng=start, extent=(end - start))
-            return
-
-        if t == "POINT":
-            p = e.dxf.location
-            x, y = xform.w2p(p.x, p.y)
-            # Render as a small filled dot in physical units.
-            r_pt = 0.4 * mm
-            c.circle(x, y, r_pt, stroke=0, fill=1)
-            return
-
-        if t == "SPLINE":
-            pts = _flatten_path_entity_points(
-                e, scale_wu_to_pt=xform.scale_wu_to_pt, flatten_mm=0.5
-            )
-            _draw_polyline_from_vec3(c, xform, pts)
-            return
-
-        if t == "ELLIPSE":
-            pts = _flatten_path_entity_points(
-                e, scale_wu_to_pt=xform.scale_wu_to_pt, flatten_mm=0.5
-            )
-            _draw_polyline_from_vec3(c, xform, pts)
-            return
+        clip = c.beginPath()
+        clip.rect(*clip_rect_pt)
+        c.clipPath(clip, stroke=0, fill=0)
+        c.translate(x_pt, y_pt)
+        c.doForm(name)
     finally:
         c.restoreState()
 
@@ -474,14 +1165,163 @@ def compute_tiles(bbox: Tuple[float, float, float, float], printable_w_wu: float
     nx = max(1, math.ceil((total_w - overlap_wu) / step_w))
     ny = max(1, math.ceil((total_h - overlap_wu) / step_h))
 
-    tiles = []
-    for j in range(ny):
-        for i in range(nx):
-            x0 = minx + i * step_w
-            y0 = miny + j * step_h
-            tiles.append((i, j, x0, y0))
+    # One row per tile: (i, j, x0, y0), row-major (i varies fastest).
+    ii, jj = np.meshgrid(np.arange(nx), np.arange(ny))
+    tiles = np.stack(
+        [ii, jj, minx + ii * step_w, miny + jj * step_h], axis=-1
+    ).reshape(-1, 4)
     return tiles, nx, ny
 
+
+def drop_empty_tiles(job: TileJob, tiles: np.ndarray) -> np.ndarray:
+    """Keep only the `compute_tiles` rows whose printable area touches an entity.
+
+    The first tile is kept if every tile would be dropped.
+    """
+    keep = [(int(i), int(j)) in job.grid for (i, j, _x0, _y0) in tiles.tolist()]
+    if not any(keep):
+        keep[0] = True
+    return tiles[np.array(keep)]
+
+
+def draw_tile_page(
+    c: canvas.Canvas,
+    job: TileJob,
+    i: int,
+    j: int,
+    tile_x0_wu: float,
+    tile_y0_wu: float,
+) -> None:
+    """Draw the content of tile (i, j) onto the current page (no showPage)."""
+    spec = job.spec
+    scale = job.scale_wu_to_pt
+
+    # page header
+    c.setFont("Helvetica", 9)
+    c.drawString(spec.margin_pt, spec.height_pt -
+                 spec.margin_pt + 2, f"Tile {i+1}/{job.nx} x {j+1}/{job.ny}")
+
+    # printable rect (optional visual aid)
+    x0p = spec.margin_pt
+
+    # scale bar: print only on the first page, near top-left
+    if (i, j) == job.scale_bar_tile:
+        y_top_printable = spec.height_pt - spec.margin_pt
+        draw_scale_bar(c, x0p + SCALE_BAR_INSET_PT, y_top_printable -
+                       SCALE_BAR_DROP_PT, length_mm=100.0)
+
+    if job.marks == "crop":
+        c.saveState()
+        c.setLineWidth(0.5)
+        draw_crop_marks(
+            c,
+            spec.margin_pt,
+            spec.margin_pt,
+            spec.margin_pt + job.printable_w_pt,
+            spec.margin_pt + job.printable_h_pt,
+        )
+        c.restoreState()
+    else:
+        # Edge-alignment marks: align the next page's PAPER EDGE to these marks.
+        # Only draw where a neighbor exists; both seams share one stroke.
+        seam_x = job.step_w_pt if i < job.nx - 1 else None
+        seam_y = job.step_h_pt if j < job.ny - 1 else None
+        if seam_x is not None or seam_y is not None:
+            draw_edge_alignment_dashed_line(
+                c,
+                seam_x_pt=seam_x,
+                seam_y_pt=seam_y,
+                page_w_pt=spec.width_pt,
+                page_h_pt=spec.height_pt,
+                inset_pt=SEAM_INSET_PT,
+            )
+
+    c.setLineWidth(1)
+    if job.use_form:
+        # The shared form is drawn relative to the drawing's min corner.
+        place_pattern_form(
+            c,
+            x_pt=spec.margin_pt - (tile_x0_wu - job.bbox[0]) * scale,
+            y_pt=spec.margin_pt - (tile_y0_wu - job.bbox[1]) * scale,
+            clip_rect_pt=(spec.margin_pt, spec.margin_pt,
+                          job.printable_w_pt, job.printable_h_pt),
+        )
+    else:
+        # world->page transform for this tile
+        xform = job.xform
+        xform.world_x0 = tile_x0_wu
+        xform.world_y0 = tile_y0_wu
+        affine = xform.affine(PATH_UNITS_PER_PT)
+
+        # Only entities binned under this tile (bbox overlaps its printable
+        # area) are drawn, clipped to that area so nothing spills into the
+        # margins and off-tile vertices don't bloat the page stream.
+        begin_path_units(c)
+        draw_entities(c, job.entities, job.grid.get((i, j), {}), affine,
+                      clip_rect=job.tile_rect_wu(tile_x0_wu, tile_y0_wu))
+        c.restoreState()
+
+    # Show where this tile sits in overall pattern (optional text)
+    c.setFont("Helvetica", 7)
+    c.drawString(spec.margin_pt, spec.margin_pt - 8,
+                 f"World origin for tile: ({tile_x0_wu:.2f}, {tile_y0_wu:.2f}) {job.dxf_units}")
+
+
+# Set once per worker process by _init_tile_worker so each task only carries
+# its tile coordinates.
+_WORKER_JOB: Optional[TileJob] = None
+
+
+def _init_tile_worker(job: TileJob, use_jit: bool) -> None:
+    global _WORKER_JOB
+    _WORKER_JOB = job
+    if use_jit:
+        use_jit_transform()
+
+
+def render_tiles(tiles: List[Tuple[float, float, float, float]]) -> bytes:
+    """Worker: render `compute_tiles` rows of the pool's TileJob as one PDF, a page each."""
+    job = _WORKER_JOB
+    buf = io.BytesIO()
+    c = new_canvas(buf, pagesize=(job.spec.width_pt, job.spec.height_pt))
+    c.setLineWidth(0.6)
+    for (i, j, tile_x0_wu, tile_y0_wu) in tiles:
+        draw_tile_page(c, job, int(i), int(j), tile_x0_wu, tile_y0_wu)
+        c.showPage()
+    c.save()
+    return buf.getvalue()
+
+
+def render_tiles_parallel(
+    job: TileJob,
+    tiles: np.ndarray,
+    output_pdf: str,
+    *,
+    jobs: int,
+    use_jit: bool = False,
+) -> None:
+    """Render tiles across a process pool and concatenate the pages in order.
+
+    Tiles go out in contiguous batches, a few per worker for load balancing,
+    so each worker writes (and the parent parses and merges) a handful of
+    multi-page PDFs instead of one document per tile.
+    """
+    try:
+        from pypdf import PdfReader, PdfWriter
+    except ImportError:
+        raise SystemExit("Error: --jobs needs the 'pypdf' package (pip install pypdf)")
+
+    processes = min(jobs, len(tiles))
+    batches = [b.tolist() for b in
+               np.array_split(tiles, min(len(tiles), 4 * processes))]
+    writer = PdfWriter()
+    with Pool(processes=processes,
+              initializer=_init_tile_worker, initargs=(job, use_jit)) as pool:
+        for batch_pdf in pool.imap(render_tiles, batches):
+            writer.append(PdfReader(io.BytesIO(batch_pdf)))
+    with open(output_pdf, "wb") as f:
+        writer.write(f)
+
 # ----------------------------
 # Main
 # ----------------------------
@@ -509,7 +1349,46 @@ def main():
         action="store_true",
         help="Skip entities whose effective linetype is not CONTINUOUS (e.g. DASHED). Alias: --no-dashed",
     )
+    ap.add_argument(
+        "--marks",
+        default="edge",
+        choices=["edge", "crop"],
+        help="Page alignment marks: 'edge' draws dashed seam lines where the "
+             "neighbouring page's paper edge goes; 'crop' marks the printable "
+             "area's corners.",
+    )
+    ap.add_argument(
+        "--skip-empty-tiles",
+        action="store_true",
+        help="Don't print tiles whose printable area contains no geometry "
+             "(e.g. the empty corner of an L-shaped pattern).",
+    )
+    ap.add_argument(
+        "--form-xobject",
+        action="store_true",
+        help="Draw the geometry once as a PDF form and reuse it on every tile "
+             "(clipped to the printable area). Much smaller output for large tilings.",
+    )
+    ap.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Render tiles in N worker processes (0 = one per CPU). "
+             "N > 1 requires pypdf; not combinable with --form-xobject.",
+    )
+    ap.add_argument(
+        "--numba",
+        action="store_true",
+        help="JIT-compile the point transform and path formatting with numba. "
+             "The compile cost only pays off on very large drawings.",
+    )
     args = ap.parse_args()
+    if args.jobs < 0:
+        ap.error("--jobs must be >= 0")
+    if args.form_xobject and args.jobs != 1:
+        ap.error("--jobs can't be combined with --form-xobject")
+    if args.numba and importlib.util.find_spec("numba") is None:
+        ap.error("--numba needs the 'numba' package (pip install numba)")
 
     output_pdf = args.output_pdf
     if not output_pdf:
@@ -518,12 +1397,12 @@ def main():
     if os.path.exists(output_pdf):
         raise SystemExit(f"Error: output PDF already exists: {output_pdf}")
 
+    import ezdxf
+
     doc = ezdxf.readfile(args.input_dxf)
     layer_list = [s.strip()
                   for s in args.layers.split(",")] if args.layers else None
 
-    ents_list = list(iter_entities(doc, layers=layer_list))
-
     # Map DXF units -> PDF points (1 pt = 1/72 inch)
     if args.dxf_units == "mm":
         scale = mm  # reportlab unit: 1mm in points
@@ -537,7 +1416,20 @@ def main():
         margin_pt = args.margin_mm * mm
         overlap_pt = args.overlap_mm * mm
 
-    bbox = drawing_bbox_wu(ents_list, scale_wu_to_pt=scale)
+    # Extract geometry (and flatten curves) once; the bbox and every tile
+    # reuse it. Entities are streamed straight from the modelspace, and the
+    # ezdxf document is released afterwards: only the compact NumPy geometry
+    # is kept for rendering.
+    prepared = prepare_entities(
+        iter_entities(doc, layers=layer_list), scale_wu_to_pt=scale, doc=doc
+    )
+    del doc
+    bbox = prepared_bbox_wu(prepared)
+    if args.exclude_noncontinuous_linetypes:
+        prepared = [rec for rec in prepared if rec.continuous]
+    # Pack into flat arrays for tiling; the per-entity records go away.
+    entities = EntityArrays.pack(prepared)
+    del prepared
 
     page_w_pt, page_h_pt = page_size(args.page)
     spec = PageSpec(width_pt=page_w_pt, height_pt=page_h_pt,
@@ -554,72 +1446,54 @@ def main():
     tiles, nx, ny = compute_tiles(
         bbox, printable_w_wu, printable_h_wu, overlap_wu)
 
-    c = canvas.Canvas(output_pdf, pagesize=(
-        spec.width_pt, spec.height_pt))
-    c.setLineWidth(0.6)
-
-    for (i, j, tile_x0_wu, tile_y0_wu) in tiles:
-        # page header
-        c.setFont("Helvetica", 9)
-        c.drawString(spec.margin_pt, spec.height_pt -
-                     spec.margin_pt + 2, f"Tile {i+1}/{nx} x {j+1}/{ny}")
-
-        # printable rect (optional visual aid)
-        x0p = spec.margin_pt
-
-        # scale bar: print only on the first page, near top-left
-        if i == 0 and j == 0:
-            y_top_printable = spec.height_pt - spec.margin_pt
-            draw_scale_bar(c, x0p + 5 * mm, y_top_printable -
-                           8 * mm, length_mm=100.0)
-
-        # Edge-alignment marks: align the next page's PAPER EDGE to these marks.
-        # Only draw where a neighbor exists.
-        inset_pt = 10 * mm
-        if i < nx - 1:
-            draw_edge_alignment_dashed_line(
-                c,
-                seam_x_pt=step_w_pt,
-                seam_y_pt=None,
-                page_w_pt=spec.width_pt,
-                page_h_pt=spec.height_pt,
-                inset_pt=inset_pt,
-            )
-        if j < ny - 1:
-            draw_edge_alignment_dashed_line(
-                c,
-                seam_x_pt=None,
-                seam_y_pt=step_h_pt,
-                page_w_pt=spec.width_pt,
-                page_h_pt=spec.height_pt,
-                inset_pt=inset_pt,
-            )
-
-        # world->page transform for this tile
-        xform = WorldToPage(
+    job = TileJob(
+        spec=spec,
+        scale_wu_to_pt=scale,
+        bbox=bbox,
+        nx=nx,
+        ny=ny,
+        step_w_pt=step_w_pt,
+        step_h_pt=step_h_pt,
+        printable_w_pt=printable_w_pt,
+        printable_h_pt=printable_h_pt,
+        printable_w_wu=printable_w_wu,
+        printable_h_wu=printable_h_wu,
+        dxf_units=args.dxf_units,
+        entities=entities,
+        xform=WorldToPage(
             scale_wu_to_pt=scale,
-            world_x0=tile_x0_wu,
-            world_y0=tile_y0_wu,
+            world_x0=bbox[0],
+            world_y0=bbox[1],
             page_x0_pt=spec.margin_pt,
             page_y0_pt=spec.margin_pt,
-        )
+        ),
+        use_form=args.form_xobject,
+        marks=args.marks,
+    )
+    job.bin_entities(tiles)
 
-        # Draw entities (no clipping here; simple + robust. optional clip could be added.)
-        c.setLineWidth(1)
-        for e in ents_list:
-            draw_entity(
-                c,
-                e,
-                xform,
-                doc=doc,
-                exclude_noncontinuous_linetypes=args.exclude_noncontinuous_linetypes,
-            )
+    if args.skip_empty_tiles:
+        # Tiles keep their grid labels (they're assembly positions); the scale
+        # bar moves to the first page that is actually printed.
+        tiles = drop_empty_tiles(job, tiles)
+        job.scale_bar_tile = (int(tiles[0, 0]), int(tiles[0, 1]))
 
-        # Show where this tile sits in overall pattern (optional text)
-        c.setFont("Helvetica", 7)
-        c.drawString(spec.margin_pt, spec.margin_pt - 8,
-                     f"World origin for tile: ({tile_x0_wu:.2f}, {tile_y0_wu:.2f}) {args.dxf_units}")
+    if args.numba:
+        use_jit_transform()
+
+    jobs = args.jobs or os.cpu_count() or 1
+    if jobs > 1 and len(tiles) > 1:
+        render_tiles_parallel(job, tiles, output_pdf, jobs=jobs, use_jit=args.numba)
+        return
+
+    c = new_canvas(output_pdf, pagesize=(
+        spec.width_pt, spec.height_pt))
+    if job.use_form:
+        draw_pattern_form(c, job.entities, bbox=bbox, scale_wu_to_pt=scale)
+    c.setLineWidth(0.6)
 
+    for (i, j, tile_x0_wu, tile_y0_wu) in tiles.tolist():
+        draw_tile_page(c, job, int(i), int(j), tile_x0_wu, tile_y0_wu)
         c.showPage()
 
     c.save()
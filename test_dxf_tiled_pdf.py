@@ -0,0 +1,127 @@
+import io
+import unittest
+
+import numpy as np
+
+import dxf_tiled_pdf as d
+
+
+class SimplifyPolylineTest(unittest.TestCase):
+    def test_drops_every_other_collinear_point(self):
+        pts = np.array([[0, 0], [1, 0], [2, 0], [3, 0], [4, 0]], dtype=np.float64)
+        np.testing.assert_array_equal(d._simplify_polyline(pts, 0.01), pts[[0, 2, 4]])
+
+    def test_keeps_points_off_the_neighbour_chord(self):
+        pts = np.array([[0, 0], [1, 0.1], [2, 0]], dtype=np.float64)
+        np.testing.assert_array_equal(d._simplify_polyline(pts, 0.01), pts)
+
+    def test_keeps_hairpin_tip_past_segment_end(self):
+        # The tip at x=10 lies on the line through the end points but far
+        # beyond the segment between them.
+        pts = np.array([[0, 0], [10, 0], [5, 0.001]], dtype=np.float64)
+        np.testing.assert_array_equal(d._simplify_polyline(pts, 0.01), pts)
+
+    def test_spline_hairpin_keeps_full_extent(self):
+        import ezdxf
+        from ezdxf.path import make_path
+
+        doc = ezdxf.new()
+        spline = doc.modelspace().add_spline(
+            [(0, 0), (30, 0), (60, 0.05), (30, 0.1), (20, 0.1)])
+        flatten_mm = 0.5
+        raw = np.array([(v.x, v.y) for v in make_path(spline).flattening(flatten_mm, segments=4)])
+        pts = d._simplify_polyline(raw, 0.25 * flatten_mm)
+        self.assertAlmostEqual(pts[:, 0].max(), raw[:, 0].max(), delta=0.25 * flatten_mm)
+
+
+RECT = (0.0, 0.0, 10.0, 10.0)
+
+
+class LiangBarskyTest(unittest.TestCase):
+    def test_keep_and_parameters(self):
+        p0 = np.array([[-5, 5], [2, 2], [-5, -5], [20, 5], [-5, 5]], dtype=np.float64)
+        dp = np.array([[20, 0], [1, 1], [10, 10], [5, 0], [5, 5]], dtype=np.float64)
+        keep, t0, t1 = d._liang_barsky(p0, dp, RECT)
+        # crossing both sides, inside, entering at a corner, outside, corner touch
+        np.testing.assert_array_equal(keep, [True, True, True, False, False])
+        np.testing.assert_allclose(t0[:3], [0.25, 0.0, 0.5])
+        np.testing.assert_allclose(t1[:3], [0.75, 1.0, 1.0])
+
+    def test_segment_on_edge_is_kept(self):
+        keep, t0, t1 = d._liang_barsky(
+            np.array([[0.0, 0.0]]), np.array([[10.0, 0.0]]), RECT)
+        self.assertTrue(keep[0])
+        self.assertEqual((t0[0], t1[0]), (0.0, 1.0))
+
+
+class ClipPolylineTest(unittest.TestCase):
+    def assertPieces(self, pieces, expected):
+        self.assertEqual(len(pieces), len(expected))
+        for got, want in zip(pieces, expected):
+            np.testing.assert_allclose(got, want)
+
+    def test_inside_is_unchanged(self):
+        pts = np.array([[1, 1], [9, 1], [9, 9]], dtype=np.float64)
+        self.assertPieces(d.clip_polyline_to_rect(pts, RECT), [pts])
+
+    def test_open_crossing(self):
+        pts = np.array([[-5, 5], [5, 5], [5, 15]], dtype=np.float64)
+        self.assertPieces(d.clip_polyline_to_rect(pts, RECT),
+                          [[[0, 5], [5, 5], [5, 10]]])
+
+    def test_leaves_and_reenters(self):
+        pts = np.array([[2, 5], [2, 15], [8, 15], [8, 5]], dtype=np.float64)
+        self.assertPieces(d.clip_polyline_to_rect(pts, RECT),
+                          [[[2, 5], [2, 10]], [[8, 10], [8, 5]]])
+
+    def test_closed_ring_inside(self):
+        pts = np.array([[1, 1], [9, 1], [9, 9], [1, 9]], dtype=np.float64)
+        self.assertPieces(d.clip_polyline_to_rect(pts, RECT, closed=True),
+                          [np.concatenate((pts, pts[:1]))])
+
+    def test_closed_ring_rejoined_across_start(self):
+        # Only the right edge pokes out; the visible part runs through the
+        # start vertex and must come back as one piece.
+        pts = np.array([[5, 2], [15, 2], [15, 8], [5, 8]], dtype=np.float64)
+        self.assertPieces(d.clip_polyline_to_rect(pts, RECT, closed=True),
+                          [[[10, 8], [5, 8], [5, 2], [10, 2]]])
+
+    def test_vertices_on_edges(self):
+        pts = np.array([[0, 0], [10, 0], [10, 10], [0, 10]], dtype=np.float64)
+        self.assertPieces(d.clip_polyline_to_rect(pts, RECT, closed=True),
+                          [np.concatenate((pts, pts[:1]))])
+
+    def test_corner_touch_is_empty(self):
+        pts = np.array([[-5, 5], [0, 10], [-5, 15]], dtype=np.float64)
+        self.assertEqual(d.clip_polyline_to_rect(pts, RECT), [])
+
+    def test_outside_is_empty(self):
+        pts = np.array([[11, 11], [20, 20], [11, 20]], dtype=np.float64)
+        self.assertEqual(d.clip_polyline_to_rect(pts, RECT, closed=True), [])
+
+
+class DashedClipTest(unittest.TestCase):
+    def draw(self, dxftype, dash):
+        pts = np.array([[5, 5], [15, 5]], dtype=np.float64)
+        ents = d.EntityArrays.pack([
+            d.PreparedEntity(dxftype, (5.0, 5.0, 15.0, 5.0), pts_wu=pts, dash=dash)])
+        c = d.new_canvas(io.BytesIO())
+        d.draw_entities(c, ents, {dxftype: [0]}, (100.0, 0.0, 0.0), clip_rect=RECT)
+        return "\n".join(c._code)
+
+    def test_solid_is_cut(self):
+        for t in ("LINE", "LWPOLYLINE"):
+            code = self.draw(t, None)
+            self.assertIn("1000 500 l", code)
+            self.assertNotIn("re W n", code)
+
+    def test_dashed_keeps_geometry_under_clip_path(self):
+        # Cutting would restart the dash pattern at the tile edge.
+        for t in ("LINE", "LWPOLYLINE"):
+            code = self.draw(t, [1.0, 0.5])
+            self.assertIn("0 0 1000 1000 re W n", code)
+            self.assertIn("1500 500 l", code)
+
+
+if __name__ == "__main__":
+    unittest.main()